@@ -553,14 +553,10 @@ def get_opcode_name(opcode : int) -> str:
 
 def get_opcode_from_name(name: str) -> int:
     """
-    Search the name in the OPCODE_TO_NAME dictionary and return the opcode.
+    Look up the opcode of a command name (reverse of OPCODE_TO_NAME).
     Returns None if not found.
     """
-    name = name.upper()
-    for opcode, opcode_name in OPCODE_TO_NAME.items():
-        if opcode_name == name:
-            return opcode
-    return None
+    return _NAME_TO_OPCODE.get(name.upper())
 
 # Generate opcodes for all commands
 def initialize_opcodes():
@@ -607,6 +603,13 @@ def initialize_opcodes():
 # Initialize the opcode to name dictionary
 initialize_opcodes()
 
+# reverse of OPCODE_TO_NAME for get_opcode_from_name, the first opcode wins
+# if a name ever repeats, same as the old front-to-back search
+_NAME_TO_OPCODE : dict[str, int] = {}
+for _opcode, _name in OPCODE_TO_NAME.items():
+    _NAME_TO_OPCODE.setdefault(_name, _opcode)
+del _opcode, _name
+
 
 
 
@@ -631,64 +634,63 @@ class cmd_type(IntEnum):
     # Add more command types as needed
     def __repr__(self):
         """String representation of command types"""
-        return {
-                self.LINK_CONTROL: "Link Control",
-                self.LINK_POLICY: "Link Policy",
-                self.CONTROLLER_BASEBAND: "Controller & Baseband",
-                self.INFORMATION: "Informational",
-                self.STATUS: "Status",
-                self.TESTING: "Testing",
-                self.LE: "LE",
-                self.VENDOR_SPECIFIC: 'vendor_specific'
-            }
+        return _CMD_TYPE_LABEL.get(self, "Unknown")
     
     def __str__(self):
         """String representation of command types"""
-        return {
-                self.LINK_CONTROL: "Link Control",
-                self.LINK_POLICY: "Link Policy",
-                self.CONTROLLER_BASEBAND: "Controller & Baseband",
-                self.INFORMATION: "Informational",
-                self.STATUS: "Status",
-                self.TESTING: "Testing",
-                self.LE: "LE",
-                self.VENDOR_SPECIFIC: 'vendor_specific'
-                }.get(self, "Unknown")
+        return _CMD_TYPE_LABEL.get(self, "Unknown")
     
     @classmethod
     def get_ogf(cls, category : str) -> OGF:
-        return {
-                "Link Control" : OGF.LINK_CONTROL ,
-                "Link Policy" : OGF.LINK_POLICY ,
-                "Controller & Baseband" : OGF.CONTROLLER_BASEBAND ,
-                "Informational" : OGF.INFORMATION,
-                "Status" : OGF.STATUS,
-                "Testing" : OGF.TESTING,
-                "LE" : OGF.LE,
-                "vendor_specific" : OGF.VENDOR_SPECIFIC
-                }[category]
+        return _CMD_TYPE_OGF[category]
     
 
+# display labels of the command types, built once rather than on every str()
+_CMD_TYPE_LABEL = {
+    cmd_type.LINK_CONTROL: "Link Control",
+    cmd_type.LINK_POLICY: "Link Policy",
+    cmd_type.CONTROLLER_BASEBAND: "Controller & Baseband",
+    cmd_type.INFORMATION: "Informational",
+    cmd_type.STATUS: "Status",
+    cmd_type.TESTING: "Testing",
+    cmd_type.LE: "LE",
+    cmd_type.VENDOR_SPECIFIC: 'vendor_specific'
+}
+# display label -> OGF, for get_ogf
+_CMD_TYPE_OGF = {
+    "Link Control" : OGF.LINK_CONTROL ,
+    "Link Policy" : OGF.LINK_POLICY ,
+    "Controller & Baseband" : OGF.CONTROLLER_BASEBAND ,
+    "Informational" : OGF.INFORMATION,
+    "Status" : OGF.STATUS,
+    "Testing" : OGF.TESTING,
+    "LE" : OGF.LE,
+    "vendor_specific" : OGF.VENDOR_SPECIFIC
+}
+# labels in enum order, e.g. for populating a selector
+CMD_TYPE_LABELS = tuple(_CMD_TYPE_LABEL[cmd] for cmd in cmd_type)
+
         
 #MARK: commands
 @dataclass
 class commands_list:
+    # command names per OGF, built once at import; tuples so they can be shared
     #link control commands list 
-    LINK_CONTROL = [cmd.name for cmd in LinkControlOCF]
+    LINK_CONTROL = tuple(cmd.name for cmd in LinkControlOCF)
     #link policy commands list
-    LINK_POLICY = [ cmd.name for cmd in LinkPolicyOCF ]
+    LINK_POLICY = tuple(cmd.name for cmd in LinkPolicyOCF)
     #controller baseband commands list
-    CONTROLLER_BASEBAND = [ cmd.name for cmd in ControllerBasebandOCF ]
+    CONTROLLER_BASEBAND = tuple(cmd.name for cmd in ControllerBasebandOCF)
     #information commands list
-    INFORMATION = [ cmd.name for cmd in InformationOCF ]
+    INFORMATION = tuple(cmd.name for cmd in InformationOCF)
     #status commands list
-    STATUS = [ cmd.name for cmd in StatusOCF ]
+    STATUS = tuple(cmd.name for cmd in StatusOCF)
     #testing commands list
-    TESTING = [ cmd.name for cmd in TestingOCF ]
+    TESTING = tuple(cmd.name for cmd in TestingOCF)
     #le controller commands list
-    LE = [ cmd.name for cmd in LEControllerOCF ]
+    LE = tuple(cmd.name for cmd in LEControllerOCF)
     #vendor specific commands list
-    VENDOR_SPECIFIC = [ cmd.name for cmd in VendorSpecificOCF ]
+    VENDOR_SPECIFIC = tuple(cmd.name for cmd in VendorSpecificOCF)
     # Add more command types as needed
         
         
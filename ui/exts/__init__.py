@@ -1,25 +1,11 @@
 """
 UI extensions package.
+
+The tool window modules are imported on first access (PEP 562), so importing
+the package, or one of its modules, no longer loads every other window.
 """
 
-from .audio_offload import *
-from .l2cap_util import *
-from .test_window_base import *
-from .a2dp_test import *
-from .config_chip import *
-from .diagnostic import *
-from .fw_formats import *
-from .firmware_download import *
-from .hci_window import *
-from .hid_test import *
-from .le_iso_test import *
-from .le_screen import *
-from .log_window import *
-from .log_window_async import *
-from .quick_connect import *
-from .sco_test import *
-from .throughput_test import *
-from .util_screen import *
+import importlib
 
 __all__ = [
     'a2dp_test',
@@ -41,3 +27,17 @@ __all__ = [
     'throughput_test',
     'util_screen',
 ]
+
+_SUBMODULES = frozenset(__all__) | {'connect_window'}
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | _SUBMODULES)
@@ -26,8 +26,10 @@
 """
 
 from getopt import GetoptError
-import traceback
+import logging
 import weakref
+from functools import partial
+from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import  (QMdiSubWindow)
 
 # import the hci command for execution
@@ -38,14 +40,22 @@ from hci.cmd.cmd_opcodes import cmd_type, get_opcode_from_name, create_opcode, c
 
 from .cmds import get_cmd_ui_class
 from .cmds import HCICmdUI
+from .hci_base_ui import HciWindowGroup
 
 from transports.transport import Transport
 from typing import ClassVar, Optional, Dict, Type
 
+# messages are formatted only when a handler takes the record
+logger = logging.getLogger(__name__)
+
 
 # Import other command classes as needed
 #MARK: cmd factory
 class HCICommandFactory:
+    # (category, command name) -> (OGF, opcode), shared by every factory since
+    # the opcode tables are static; saves the name search on repeated opens
+    _resolved_commands : ClassVar[Dict[tuple[str, str], tuple[OGF, Optional[int]]]] = {}
+
     def __init__(self, title : str, parent_window : QMdiSubWindow,
                  transport : Transport, session = None):
         self.title = title
@@ -58,6 +68,8 @@ class HCICommandFactory:
         self._is_destroyed = False
         # create a dictionary to track command windows and structure as {opcode: HCICmdUI}
         self.command_windows : dict[int, HCICmdUI] = {}
+        # every command window listens on this to be raised together
+        self._window_group = HciWindowGroup()
 
     def __del__(self):  
         """Destructor to ensure all command windows are closed"""
@@ -131,7 +143,9 @@ class HCICommandFactory:
             return self.send_command(instance)
                 
         cmd_window.add_ok_btn_callback(_ok_btn_callback)
-        cmd_window.window_closing.connect( lambda : self.close_command_window(cmd_opcode))
+        cmd_window.window_closing.connect(partial(self.close_command_window, cmd_opcode),
+                                          Qt.DirectConnection)
+        self._window_group.raise_all.connect(cmd_window.raise_if_visible)
         # Store in our local tracking
         self.command_windows[cmd_opcode] = cmd_window
         
@@ -183,8 +197,7 @@ class HCICommandFactory:
                 window.move(new_x, new_y)
             except Exception as e:
                 # Parent window has been deleted, skip positioning
-                print(f"error in positioning command window, {e}")
-                pass
+                logger.debug("error in positioning command window, %s", e)
     
     
     def get_command_window_by_opcode(self, cmd_opcode: int) -> Optional[HCICmdUI]:
@@ -256,20 +269,25 @@ class HCICommandFactory:
     
     def close_all_command_windows(self):
         """Close all open command windows"""
-        for cmd_opcode in list[int](self.command_windows.keys()):
-            self.close_command_window(cmd_opcode)
-        self.command_windows.clear()
+        # detach the tracking dict first: each close emits window_closing, whose
+        # pop now lands on the empty dict instead of the one being iterated
+        windows, self.command_windows = self.command_windows, {}
+        # hidden windows are closed too, otherwise they leave the dict without
+        # ever being cleaned up
+        for window in windows.values():
+            try:
+                window.close()
+            except RuntimeError:
+                # Window already destroyed
+                pass
     
     def raise_all_windows(self):
         """Raise all command windows to the front"""
-        for cmd_opcode, window in list[tuple[int, HCICmdUI]](self.command_windows.items()):
-            try:
-                if window.isVisible():
-                    window.raise_()
-                    window.activateWindow()
-            except RuntimeError:
-                # Window has been deleted, remove from tracking
-                self.command_windows.pop(cmd_opcode, None)
+        # nothing open is the common case for a click; skip the signal dispatch
+        if not self.command_windows:
+            return
+        # one emit reaches every live window, deleted ones are disconnected by Qt
+        self._window_group.raise_all.emit()
 
 
     #MARK: Cmds Executors
@@ -398,9 +416,13 @@ class HCICommandFactory:
         Returns:
             bool: True if the command was executed successfully, False otherwise.
         """
-        ogf = cmd_type.get_ogf(category)
-        # cmd_opcode = create_opcode(ogf, opcode)
-        cmd_opcode = get_opcode_from_name(cmd_type.get_ogf(category).name + '_' + opcode)
+        resolved = HCICommandFactory._resolved_commands.get((category, opcode))
+        if resolved is None:
+            ogf = cmd_type.get_ogf(category)
+            # cmd_opcode = create_opcode(ogf, opcode)
+            cmd_opcode = get_opcode_from_name(ogf.name + '_' + opcode)
+            resolved = HCICommandFactory._resolved_commands[(category, opcode)] = (ogf, cmd_opcode)
+        ogf, cmd_opcode = resolved
         try:
             #execute the command based on the OGF and OCF values
             if ogf == OGF.CONTROLLER_BASEBAND:
@@ -420,9 +442,8 @@ class HCICommandFactory:
             elif ogf == OGF.VENDOR_SPECIFIC:
                 return self.default_vendor_cmd_executor(cmd_opcode, **kwargs)
             else:
-                print(f"Unknown OGF {ogf} for opcode {cmd_opcode}")
+                logger.error("Unknown OGF %s for opcode %s", ogf, cmd_opcode)
         except Exception as e:
-            print(f"Error opening command UI: {e} ")
-            # also point where the error happened
-            traceback.print_exc()
+            # logger.exception also records where the error happened
+            logger.exception("Error opening command UI: %s", e)
     
\ No newline at end of file
@@ -22,15 +22,17 @@ from __future__ import annotations
 
 import traceback
 import weakref
+from functools import partial
 from typing import Dict, Optional, Type
 
-from PyQt5.QtCore import QObject, pyqtSignal
+from PyQt5.QtCore import QObject, Qt, pyqtSignal
 from PyQt5.QtWidgets import QMdiSubWindow
 
 from hci.session.session import EVT_COMMAND_SENT, EVT_EVENT
 
 from .evts import get_event_ui_class, get_event_ui_class_for, window_key_of
 from .evts.evt_baseui import HCIEvtUI
+from .hci_base_ui import HciWindowGroup
 
 from transports.transport import Transport
 
@@ -93,6 +95,8 @@ class HCIEventFactory:
 
         # window key -> live window. Several event codes may share a key.
         self.event_windows: Dict[str, HCIEvtUI] = {}
+        # every event window listens on this to be raised together
+        self._window_group = HciWindowGroup()
 
         self._bridge: Optional[_SessionBridge] = None
         if session is not None:
@@ -220,7 +224,9 @@ class HCIEventFactory:
             traceback.print_exc()
             return None
 
-        window.window_closing.connect(lambda *_: self.close_event_window(key))
+        window.window_closing.connect(partial(self.close_event_window, key),
+                                      Qt.DirectConnection)
+        self._window_group.raise_all.connect(window.raise_if_visible)
         self.event_windows[key] = window
 
         self.position_window(window)
@@ -288,14 +294,11 @@ class HCIEventFactory:
 
     def raise_all_windows(self):
         """Raise all event windows to the front"""
-        for key, window in list(self.event_windows.items()):
-            try:
-                if window.isVisible():
-                    window.raise_()
-                    window.activateWindow()
-            except RuntimeError:
-                # Window has been deleted, remove from tracking
-                self.event_windows.pop(key, None)
+        # nothing open is the common case for a click; skip the signal dispatch
+        if not self.event_windows:
+            return
+        # one emit reaches every live window, deleted ones are disconnected by Qt
+        self._window_group.raise_all.emit()
 
     def close_event_window(self, window_key: str):
         """Close a specific event window by its key"""
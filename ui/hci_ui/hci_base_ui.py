@@ -33,6 +33,16 @@ import hci.evt as hci_evt
 from ui.exts.log_window import LogWindow
 
 
+#MARK: window group
+class HciWindowGroup(QObject):
+    """Raises a factory's windows with one signal emit
+
+    Each window connects raise_if_visible once when it is created; Qt drops the
+    connection by itself when the window is destroyed.
+    """
+    raise_all = pyqtSignal()
+
+
 #MARK: HCIBaseUI
 class HciBaseUI(QDialog):
     """Base class for HCI UI components"""
@@ -172,6 +182,12 @@ class HciBaseUI(QDialog):
         self.raise_()
         self.activateWindow()
         self.showNormal()  # In case it was minimized
+
+    def raise_if_visible(self):
+        """Raise this window if it is shown, hidden windows stay hidden"""
+        if self.isVisible():
+            self.raise_()
+            self.activateWindow()
     
     def get_parent(self):
         """Safely get the parent window"""
@@ -2,19 +2,18 @@
 
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QSizePolicy,
-    QListWidget, QListWidgetItem, QMdiArea, QMdiSubWindow,
-    QSplitter, QMainWindow, QGroupBox, QPushButton,
-    QCheckBox, QComboBox, QLineEdit, QFrame, QTabWidget
+    QListView, QMdiSubWindow, QMainWindow,
+    QCheckBox, QComboBox, QLineEdit
 )
 
-from PyQt5.QtWidgets import (
-    QKeyEventTransition, 
-)
-
-from PyQt5.QtCore import Qt, pyqtSignal
-from PyQt5.QtGui import QFont
+from PyQt5.QtCore import Qt, pyqtSignal, QEvent, QTimer, QStringListModel, QModelIndex
+from PyQt5 import sip
 
-from typing import Optional
+import re
+from bisect import bisect_left
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Optional, Sequence
 
 from transports.transport import Transport, TransportEvent
 
@@ -24,10 +23,48 @@ from .evt_factory import HCIEventFactory
 
 from .cmds.cmd_baseui import HCICmdUI
 
-from hci.cmd.cmd_opcodes import cmd_type, commands_list
+from hci.cmd.cmd_opcodes import cmd_type, commands_list, CMD_TYPE_LABELS as _CATEGORIES
 from hci.session import HciSession
 
 
+# Command names per category, in the same order as the combo box so the
+# current index selects the tuple directly
+_COMMANDS_BY_INDEX : tuple[tuple[str, ...], ...] = tuple(
+    getattr(commands_list, cmd.name) for cmd in cmd_type
+)
+# Lowercased names for the search box, so filtering never calls lower() per keystroke
+_COMMANDS_LOWER_BY_INDEX : tuple[tuple[str, ...], ...] = tuple(
+    tuple(name.lower() for name in commands) for commands in _COMMANDS_BY_INDEX
+)
+# All lowercased names of a category in one string, a single substring test
+# on it tells whether the search can match anything at all
+_COMMANDS_HAYSTACK_BY_INDEX : tuple[str, ...] = tuple(
+    "\n".join(lowers) for lowers in _COMMANDS_LOWER_BY_INDEX
+)
+
+
+# a search starting with this is a regular expression instead of plain text
+_REGEX_PREFIX = "/"
+
+
+@lru_cache(maxsize=32)
+def _compile_search(pattern: str) -> Optional[re.Pattern]:
+    """Compile a search box regex once, None if the pattern is not valid (yet)"""
+    try:
+        return re.compile(pattern, re.IGNORECASE)
+    except re.error:
+        return None
+
+
+@contextmanager
+def _signals_blocked(widget: QWidget):
+    """Block a widget's signals for a batch update, restoring the previous state"""
+    previous = widget.blockSignals(True)
+    try:
+        yield widget
+    finally:
+        widget.blockSignals(previous)
+
 
 #MARK: HCiCmdSlctr
 class HciCommandSelector(QWidget):
@@ -38,12 +75,19 @@ class HciCommandSelector(QWidget):
     
     def __init__(self, baudrate):
         super().__init__()
-        self.categories = []
-        self.commands = {}
-        # filtered commands and results for navigation
-        self.filtered_commands = {}
-        self.filtered_results = []  # Store filtered results for navigation
-        self.current_match_index = -1  # Track current match index
+        self.categories = ()
+        # commands of the selected category that pass the current search
+        self.filtered_list : Sequence[str] = ()
+        # (search text, category index) the list currently shows
+        self._last_filter_key : tuple[Optional[str], int] = (None, -1)
+        # last search and its (row, lowercased name) matches per category, so
+        # a longer query only rescans what the shorter one already matched
+        self._last_search = ""
+        self._last_filtered : dict[str, list[tuple[int, str]]] = {}
+        # category index loaded in the list model and its rows left visible
+        # by the filter, in row order
+        self._model_index = -1
+        self._visible_rows : list[int] = []
         
         # flag to track if the instance is destroyed
         self._is_destroyed = False  
@@ -62,9 +106,13 @@ class HciCommandSelector(QWidget):
         if self._is_destroyed:
             return
         self._is_destroyed = True
+        # a pending debounced search must not fire into a widget being torn down
+        try:
+            self._filter_timer.stop()
+        except (RuntimeError, AttributeError):
+            # timer already deleted with the widget, or never created
+            pass
         # Qt elements are automatically deleted when the parent is deleted
-        # so we don't need to do anything here
-        pass
 
     def init_ui(self,baudrate):
         """Initialize the UI components"""
@@ -101,17 +149,27 @@ class HciCommandSelector(QWidget):
         # categories_layout.addWidget(line)
         
         
+        # everything below the enable row is switched on/off with the device
+        # as one widget, Qt propagates the state to the children in one pass
+        self._controls_container = QWidget()
+        controls_layout = QVBoxLayout(self._controls_container)
+        controls_layout.setContentsMargins(0, 0, 0, 0)
+        
         # Command type selector
         type_layout = QHBoxLayout()
         type_layout.addWidget(QLabel("Command Type:"))
         
         self.command_type_combo = QComboBox()
-        for cmd in cmd_type:
-            self.command_type_combo.addItem(str(cmd))
+        # size from a fixed character count instead of measuring every item
+        self.command_type_combo.setSizeAdjustPolicy(QComboBox.AdjustToMinimumContentsLengthWithIcon)
+        self.command_type_combo.setMinimumContentsLength(max(map(len, _CATEGORIES)))
+        # the list is populated once by load_commands, no per-item updates needed
+        with _signals_blocked(self.command_type_combo):
+            self.command_type_combo.addItems(_CATEGORIES)
         self.command_type_combo.currentIndexChanged.connect(self._on_category_selected)
         type_layout.addWidget(self.command_type_combo)
         
-        categories_layout.addLayout(type_layout)
+        controls_layout.addLayout(type_layout)
         
         # Search box
         search_layout = QHBoxLayout()
@@ -119,104 +177,126 @@ class HciCommandSelector(QWidget):
         
         self.search_box = QLineEdit()
         self.search_box.setPlaceholderText("Search commands...")
-        # filter commands when text is changed
-        self.search_box.textChanged.connect(self.filter_commands)
+        # filter commands once typing pauses instead of on every keystroke
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(80)
+        self._filter_timer.timeout.connect(self._refresh_list)
+        self.search_box.textChanged.connect(self._schedule_filter)
         self.search_box.setClearButtonEnabled(True)  # Enable clear button
         self.search_box.installEventFilter(self)  # Install event filter for keyboard handling
         search_layout.addWidget(self.search_box)
         
-        categories_layout.addLayout(search_layout)
+        controls_layout.addLayout(search_layout)
         
         # Commands list
-        commands_layout = QVBoxLayout()
-        self.commands_list = QListWidget()
+        # a view over a string model holding the whole selected category;
+        # filtering only hides and shows rows, the model is reset on a
+        # category change
+        self.commands_list = QListView()
+        self._cmd_model = QStringListModel(self)
+        self.commands_list.setModel(self._cmd_model)
+        # rows are single-line names: skip per-row size hints and lay out in batches
+        self.commands_list.setUniformItemSizes(True)
+        self.commands_list.setLayoutMode(QListView.Batched)
+        self.commands_list.setBatchSize(128)
+        self.commands_list.setEditTriggers(QListView.NoEditTriggers)
         # call this on_command_selected when a command is clicked by mouse or Enter key
-        self.commands_list.itemDoubleClicked.connect(self._on_command_cliked)   # Double-click
+        self.commands_list.doubleClicked.connect(self._on_command_cliked)   # Double-click
         # Install event filter for keyboard handling
         self.commands_list.installEventFilter(self)
+        # key -> handler for each filtered widget, looked up once per key press
+        self._search_key_handlers = {
+            Qt.Key_Return: self._on_search_enter,
+            Qt.Key_Enter: self._on_search_enter,
+            Qt.Key_Down: self._on_search_down,
+            Qt.Key_Escape: self._on_search_escape,
+        }
+        self._list_key_handlers = {
+            Qt.Key_Return: self._on_list_enter,
+            Qt.Key_Enter: self._on_list_enter,
+            Qt.Key_Up: self._on_list_up,
+            Qt.Key_Down: self._on_list_down,
+            Qt.Key_Escape: self._on_list_escape,
+        }
         # self.commands_list.currentItemChanged.connect(self.on_command_selected)
-        commands_layout.addWidget(self.commands_list)
+        controls_layout.addWidget(self.commands_list)
         
         # Add lists to layout
         main_layout.addLayout(categories_layout)
-        main_layout.addLayout(commands_layout)
+        main_layout.addWidget(self._controls_container)
         
         
     def eventFilter(self, source, event):
         """Handle keyboard events for regex search navigation"""
-        if event.type() == event.KeyPress:
-            if source == self.search_box:
-                if event.key() == Qt.Key_Return or event.key() == Qt.Key_Enter:
-                    # Execute selected command
-                    if self.commands_list.currentItem():
-                        self._on_command_cliked(self.commands_list.currentItem())
-                    return True
-                elif event.key() == Qt.Key_Down:
-                    # Move focus to command list and select first item
-                    if self.commands_list.count() > 0:
-                        self.commands_list.setFocus()
-                        self.commands_list.setCurrentRow(0)
-                        self.commands_list.scrollToItem(self.commands_list.item(0))
-                    return True
-                elif event.key() == Qt.Key_Escape:
-                    # Clear search
-                    self.search_box.clear()
-                    return True
-                    
-            elif source == self.commands_list:
-                if event.key() == Qt.Key_Return or event.key() == Qt.Key_Enter:
-                    # Execute selected command
-                    current_item = self.commands_list.currentItem()
-                    if current_item:
-                        self._on_command_cliked(current_item)
-                    return True
-                elif event.key() == Qt.Key_Up:
-                    # Move up in the list
-                    current_row = self.commands_list.currentRow()
-                    if current_row > 0:
-                        self.commands_list.setCurrentRow(current_row - 1)
-                        self.commands_list.scrollToItem(self.commands_list.currentItem())
-                    else:
-                        # If at top, move focus to search box
-                        self.search_box.setFocus()
-                    return True
-                elif event.key() == Qt.Key_Down:
-                    # Move down in the list
-                    current_row = self.commands_list.currentRow()
-                    if current_row < self.commands_list.count() - 1:
-                        self.commands_list.setCurrentRow(current_row + 1)
-                        self.commands_list.scrollToItem(self.commands_list.currentItem())
-                    return True
-                elif event.key() == Qt.Key_Escape:
-                    # Return focus to search box
-                    self.search_box.setFocus()
-                    return True
+        # every event of the watched widgets passes through here; anything
+        # that is not a key press is let through with a single int compare
+        if event.type() != QEvent.KeyPress:
+            return False
+        if source is self.search_box:
+            handler = self._search_key_handlers.get(event.key())
+        elif source is self.commands_list:
+            handler = self._list_key_handlers.get(event.key())
+        else:
+            handler = None
+        if handler is not None:
+            handler()
+            return True
         # Call the base class event filter for other events       
         return super().eventFilter(source, event)
+
+    def _on_search_enter(self):
+        """Enter in the search box: run the selected command"""
+        # apply a still pending search before picking the command
+        if self._filter_timer.isActive():
+            self.filter_commands()
+        # Execute selected command
+        if self.commands_list.currentIndex().isValid():
+            self._on_command_cliked(self.commands_list.currentIndex())
+
+    def _on_search_down(self):
+        """Down in the search box: move to the first command of the list"""
+        if self._filter_timer.isActive():
+            self.filter_commands()
+        # Move focus to command list and select first item
+        if self._visible_rows:
+            self.commands_list.setFocus()
+            self._select_row(self._visible_rows[0])
+
+    def _on_search_escape(self):
+        """Escape in the search box: clear the search"""
+        self.search_box.clear()
+
+    def _on_list_enter(self):
+        """Enter in the commands list: run the current command"""
+        current_index = self.commands_list.currentIndex()
+        if current_index.isValid():
+            self._on_command_cliked(current_index)
+
+    def _on_list_up(self):
+        """Up in the commands list: previous command, or back to the search box at the top"""
+        position = self._visible_position(self.commands_list.currentIndex().row())
+        if position > 0:
+            self._select_row(self._visible_rows[position - 1])
+        else:
+            # If at top, move focus to search box
+            self.search_box.setFocus()
+
+    def _on_list_down(self):
+        """Down in the commands list: next command"""
+        position = self._visible_position(self.commands_list.currentIndex().row())
+        if position < len(self._visible_rows) - 1:
+            self._select_row(self._visible_rows[position + 1])
+
+    def _on_list_escape(self):
+        """Escape in the commands list: return focus to the search box"""
+        self.search_box.setFocus()
     
     def load_commands(self):
         """Load available HCI command categories and commands"""
-        # Command categories - in a real application, this would be loaded dynamically
-        self.categories = [ str(cmd) for cmd in cmd_type ]
-        # Map category names to command type combo box indexes
-        self.category_to_index = {
-            str(cmd): index for index, cmd in enumerate[cmd_type](cmd_type)
-        }
-            
-        # Commands for each category
-        self.commands = {
-            str(cmd_type.LINK_CONTROL) : commands_list.LINK_CONTROL,
-            str(cmd_type.LINK_POLICY) : commands_list.LINK_POLICY,
-            str(cmd_type.CONTROLLER_BASEBAND) : commands_list.CONTROLLER_BASEBAND,
-            str(cmd_type.INFORMATION) : commands_list.INFORMATION,
-            str(cmd_type.STATUS) : commands_list.STATUS,
-            str(cmd_type.TESTING) : commands_list.TESTING,
-            str(cmd_type.LE) : commands_list.LE,
-            str(cmd_type.VENDOR_SPECIFIC) : commands_list.VENDOR_SPECIFIC,
-        }
-        
-        # Initialize filtered commands to match all commands
-        self.filtered_commands = dict[str, list[str]](self.commands)
+        # Command categories (shared, read-only); the commands of each one are
+        # looked up by combo box index in _COMMANDS_BY_INDEX
+        self.categories = _CATEGORIES
         
         # Populate the command type combo box
         self._on_category_selected(self.command_type_combo.currentText())
@@ -225,80 +305,140 @@ class HciCommandSelector(QWidget):
         """Update UI based on transport connection state"""
         # update the enable checkbox
         self.enable_checkbox.setChecked(True)
-        self.commands_list.setEnabled(True)
-        self.command_type_combo.setEnabled(True)
-        self.search_box.setEnabled(True)
+        self._controls_container.setEnabled(True)
         
     def _on_device_disconnected(self, *args, **kwargs):
         """Update UI based on transport connection state"""
         # update the enable checkbox
         self.enable_checkbox.setChecked(False)
-        self.commands_list.setEnabled(False)
-        self.command_type_combo.setEnabled(False)
-        self.search_box.setEnabled(False)
+        self._controls_container.setEnabled(False)
         
+    def _schedule_filter(self, *args):
+        """(Re)start the debounce timer, restarting it coalesces fast typing"""
+        self._filter_timer.start()
+
     def filter_commands(self):
-        """Filter commands by type and search text"""
-        search_text = self.search_box.text().lower()
-        
-        # Get the selected command type
+        """Filter commands right away, dropping any pending debounced run"""
+        self._filter_timer.stop()
+        self._refresh_list()
+
+    def _refresh_list(self):
+        """Rebuild the commands list from the selected category and search text
+
+        Both the debounced search and a category change end up here, so the
+        list is computed and reset once per update.
+        """
+        raw_text = self.search_box.text()
+        search_text = raw_text.lower()
+        
+        # Get the selected command type; the combo box is laid out in
+        # category order so its index maps straight onto the category
         selected_type_index = self.command_type_combo.currentIndex()
-        selected_category = self.command_type_combo.currentText()
+        if selected_type_index < 0:
+            return
+        # nothing changed since the last refresh (e.g. text set to itself)
+        filter_key = (raw_text, selected_type_index)
+        if filter_key == self._last_filter_key:
+            return
+        self._last_filter_key = filter_key
+        selected_category = self.categories[selected_type_index]
 
-        # Initialize empty filtered commands
-        self.filtered_commands = {}
-        self.filtered_results = []  # Clear previous results
-        self.current_match_index = -1  # Reset match index
-        
         # Only filter within the selected category
-        if selected_category in self.commands:
-            # Filter commands by search text
-            if search_text:
-                filtered_cmds = [
-                    cmd for cmd in self.commands[selected_category]
-                    if search_text in cmd.lower()
-                ]
-                self.filtered_commands[selected_category] = filtered_cmds
-                # Add to flat list of results for navigation
-                for cmd in filtered_cmds:
-                    self.filtered_results.append({'category': selected_category, 'command': cmd})
+        commands = _COMMANDS_BY_INDEX[selected_type_index]
+        # Filter commands by search text
+        if search_text:
+            # regex search: a longer pattern does not narrow the previous
+            # matches, so it always scans the category and caches nothing
+            if search_text.startswith(_REGEX_PREFIX):
+                pattern = _compile_search(raw_text[len(_REGEX_PREFIX):])
+                if pattern is not None:
+                    rows = [row for row, cmd in enumerate(commands) if pattern.search(cmd)]
+                else:
+                    # not a valid regex (yet), match the text literally instead
+                    needle = search_text[len(_REGEX_PREFIX):]
+                    rows = [
+                        row for row, cmd_lower in enumerate(_COMMANDS_LOWER_BY_INDEX[selected_type_index])
+                        if needle in cmd_lower
+                    ]
+                self._last_filtered = {}
             else:
-                self.filtered_commands[selected_category] = list[str](self.commands[selected_category])
+                # nothing in the category contains the text, skip the per-name scan
+                if search_text not in _COMMANDS_HAYSTACK_BY_INDEX[selected_type_index]:
+                    candidates = ()
+                # a query extending the previous one can only match a subset of it
+                elif (self._last_search and search_text.startswith(self._last_search)
+                        and selected_category in self._last_filtered):
+                    candidates = self._last_filtered[selected_category]
+                else:
+                    candidates = enumerate(_COMMANDS_LOWER_BY_INDEX[selected_type_index])
+                matched = [
+                    (row, cmd_lower) for row, cmd_lower in candidates
+                    if search_text in cmd_lower
+                ]
+                rows = [row for row, _ in matched]
+                self._last_filtered = {selected_category: matched}
+            self.filtered_list = [commands[row] for row in rows]
+        else:
+            # the shared tuple is read-only, no need to copy it
+            self.filtered_list = commands
+            rows = range(len(commands))
+            self._last_filtered = {}
+        self._last_search = search_text
         
         # Update the commands list
-        self.commands_list.clear()
-        if selected_category in self.filtered_commands:
-            for cmd in self.filtered_commands[selected_category]:
-                self.commands_list.addItem(cmd)
-        
-        # Select first match if there are results
-        if self.filtered_results:
-            self.current_match_index = 0
-            self.commands_list.setCurrentRow(0)
-            self.commands_list.scrollToItem(self.commands_list.item(0))
+        self._show_rows(selected_type_index, rows)
+        
+        # Select the first command
+        if self._visible_rows:
+            self._select_row(self._visible_rows[0])
+        else:
+            # don't leave a hidden command current for Enter to pick
+            self.commands_list.setCurrentIndex(QModelIndex())
     
     def _on_category_selected(self, current : Optional[str] = None ):
         """Handle selection of a command category"""
         if current is None:
             return 
-        
-        current_category = self.command_type_combo.currentText()
-        # Load commands for the selected category
-        self.commands_list.clear()
-        for command in self.commands.get(current_category, []):
-            self.commands_list.addItem(command)
-        # select the first command
-        if self.commands_list.count() > 0:
-            self.commands_list.setCurrentRow(0)
-            self.commands_list.scrollToItem(self.commands_list.item(0))
+        # keep the current search applied to the new category
+        self.filter_commands()
     
-    def _on_command_cliked(self, current : Optional[QListWidgetItem] = None):
+    def _show_rows(self, category_index : int, rows):
+        """Show only the given rows (ascending) of a category in the commands list"""
+        if category_index != self._model_index:
+            # a model reset also drops the view's hidden rows
+            self._cmd_model.setStringList(_COMMANDS_BY_INDEX[category_index])
+            self._model_index = category_index
+            shown = set(range(self._cmd_model.rowCount()))
+        else:
+            shown = set(self._visible_rows)
+        wanted = set(rows)
+        # only touch the rows whose visibility changes
+        for row in shown - wanted:
+            self.commands_list.setRowHidden(row, True)
+        for row in wanted - shown:
+            self.commands_list.setRowHidden(row, False)
+        self._visible_rows = list(rows)
+
+    def _visible_position(self, row : int) -> int:
+        """Position of a model row among the visible rows, -1 if it is hidden"""
+        position = bisect_left(self._visible_rows, row)
+        if position < len(self._visible_rows) and self._visible_rows[position] == row:
+            return position
+        return -1
+
+    def _select_row(self, row : int):
+        """Make a row of the commands list current and scroll it into view"""
+        index = self._cmd_model.index(row, 0)
+        self.commands_list.setCurrentIndex(index)
+        self.commands_list.scrollTo(index)
+
+    def _on_command_cliked(self, current : Optional[QModelIndex] = None):
         """Handle selection of a specific command"""
-        if current is None or self.commands_list.currentItem() is None:
+        if current is None or not current.isValid():
             return
             
         # category = self.categories_list.currentItem().text()
-        command = current.text()
+        command = current.data()
         self.command_selected.emit( self.command_type_combo.currentText(),command)
     
 
@@ -307,8 +447,13 @@ class HciCommandSelector(QWidget):
 class HciMainUI(QWidget):
     """Main UI for HCI command selection and management"""
 
-    # Static list to track all open windows
-    open_instances : list['HciMainUI'] =  []
+    # Static registry of all open windows; a dict used as an ordered set, so
+    # windows keep their open order and leave it in O(1)
+    open_instances : dict['HciMainUI', None] =  {}
+    # the same instances indexed by window title and by transport, so
+    # lookups do not walk open_instances
+    _by_name : dict[str, 'HciMainUI'] = {}
+    _by_transport : dict[Transport, 'HciMainUI'] = {}
 
     # Emitted just before the session is torn down, so attached windows
     # (Quick Connect) can detach instead of holding a dead session.
@@ -324,72 +469,48 @@ class HciMainUI(QWidget):
     def create_instance(cls, main_window, title: Optional[str] = "HCI Command Center", transport: Optional[Transport] = None) -> 'HciMainUI':
         """Create a new instance of HciMainUI"""
         # Check if an instance with the same transport already exists
-        for instance in cls.open_instances:
-            if instance.transport == transport:
-                # If an instance with the same transport exists, bring it to the front
-                try:
-                    instance.sub_window.raise_()
-                    instance.sub_window.activateWindow()
-                    return instance
-                except (RuntimeError, AttributeError):
-                    # Instance exists but window is deleted, remove from list
-                    cls.open_instances.remove(instance)
-                    break
+        instance = cls._by_transport.get(transport)
+        if instance is not None:
+            # If an instance with the same transport exists, bring it to the front
+            try:
+                instance.sub_window.raise_()
+                instance.sub_window.activateWindow()
+                return instance
+            except (RuntimeError, AttributeError):
+                # Instance exists but window is deleted, remove from list
+                instance._unregister()
         
         # Create a new instance if no existing one matches
         new_instance = cls(main_window, title=title, transport=transport)
         return new_instance
     
+    @classmethod
     def get_instance(cls, window_name_or_transport: str | Transport) -> Optional['HciMainUI']:
         """Get an instance of HciMainUI by window name or transport"""
-        for instance in list[HciMainUI](cls.open_instances):  # Create a copy to avoid modification during iteration
-            try:
-                if isinstance(window_name_or_transport, str):
-                    if instance.title == window_name_or_transport:
-                        return instance
-                elif isinstance(window_name_or_transport, Transport):
-                    # Check if the transport matches
-                    if instance.transport == window_name_or_transport:
-                        return instance
-            except (RuntimeError, AttributeError):
-                # Instance is no longer valid, remove it
-                cls.open_instances.remove(instance)
+        if isinstance(window_name_or_transport, str):
+            return cls._by_name.get(window_name_or_transport)
+        elif isinstance(window_name_or_transport, Transport):
+            return cls._by_transport.get(window_name_or_transport)
         return None
     
     @classmethod
     def get_open_instances(cls)  -> list['HciMainUI']:
         """Get a list of all open HCI Command Center windows"""
-        # Filter out invalid instances
-        valid_instances = []
-        for instance in cls.open_instances:
-            try:
-                # Try to access a property to check if the instance is still valid
-                _ = instance.title
-                valid_instances.append(instance)
-            except (RuntimeError, AttributeError):
-                # Instance is no longer valid, skip it
-                pass
-        cls.open_instances = valid_instances
-        return cls.open_instances
+        # instances unregister themselves on close (closeEvent/_cleanup), so
+        # the registry never holds dead windows
+        return list(cls.open_instances)
     
     @classmethod
     def delete_instance(cls, window_name_or_transport :  str | Transport) -> None:
         """Delete an instance of HciMainUI by window name or transport"""
-        for instance in list[HciMainUI](cls.open_instances):  # Create a copy to avoid modification during iteration
-            try:
-                if isinstance(window_name_or_transport, str):
-                    if instance.title == window_name_or_transport:
-                        instance._cleanup()
-                        break
-                elif isinstance(window_name_or_transport, Transport):
-                    # Check if the transport matches
-                    if instance.transport == window_name_or_transport:
-                        instance._cleanup()
-                        break
-            except (RuntimeError, AttributeError):
-                # Instance is no longer valid, remove it
-                if instance in cls.open_instances:
-                    cls.open_instances.remove(instance)
+        instance = cls.get_instance(window_name_or_transport)
+        if instance is None:
+            return
+        try:
+            instance._cleanup()
+        except (RuntimeError, AttributeError):
+            # Instance is no longer valid, remove it
+            instance._unregister()
                     
     @classmethod
     def close_all_instances(cls):
@@ -403,6 +524,8 @@ class HciMainUI(QWidget):
                 # Instance is already invalid
                 pass
         cls.open_instances.clear()
+        cls._by_name.clear()
+        cls._by_transport.clear()
                 
     @classmethod
     def close_instance(cls, instance: 'HciMainUI') -> None:
@@ -413,8 +536,7 @@ class HciMainUI(QWidget):
             except (RuntimeError, AttributeError):
                 # Instance is already invalid
                 pass
-            if instance in cls.open_instances:
-                cls.open_instances.remove(instance)
+            instance._unregister()
                 
     
     def __repr__(self):
@@ -451,12 +573,16 @@ class HciMainUI(QWidget):
         self._evt_factory : HCIEventFactory = None
         # transport instance
         self.transport : Transport = transport
+        # hci session over the transport, created by init_ui
+        self.session : HciSession = None
         
         self.init_ui()
         self.show_window()
         
         # Add this instance to the list of open instances
-        HciMainUI.open_instances.append(self)
+        HciMainUI.open_instances[self] = None
+        HciMainUI._by_name[self.title] = self
+        HciMainUI._by_transport[self.transport] = self
         
             
     def __del__(self):
@@ -464,6 +590,15 @@ class HciMainUI(QWidget):
         if not self._is_destroyed:
             self._cleanup()
 
+    def _unregister(self):
+        """Drop this instance from the open instance list and its indexes"""
+        HciMainUI.open_instances.pop(self, None)
+        # only drop index entries that still point at this instance
+        if HciMainUI._by_name.get(self.title) is self:
+            del HciMainUI._by_name[self.title]
+        if HciMainUI._by_transport.get(self.transport) is self:
+            del HciMainUI._by_transport[self.transport]
+
     def _cleanup(self):
         """Explicit cleanup method"""
         if self._is_destroyed:
@@ -475,33 +610,33 @@ class HciMainUI(QWidget):
         # go before the session closes under it.
         self.session_closing.emit(self)
 
-        if getattr(self, 'session', None):
+        if self.session is not None:
             try:
                 self.session.close()
             except Exception:
                 pass
             self.session = None
 
-        if hasattr(self, '_cmd_factory') and self._cmd_factory:
+        if self.command_selector is not None:
+            self.command_selector.cleanup()
+
+        if self._cmd_factory is not None:
             self._cmd_factory.cleanup()
             self._cmd_factory = None
-        if hasattr(self, '_evt_factory') and self._evt_factory:
+        if self._evt_factory is not None:
             self._evt_factory.cleanup()
             self._evt_factory = None
     
     
         # Close the subwindow safely
-        if hasattr(self, 'sub_window') and self.sub_window:
-            try:
+        # a window already deleted by Qt is skipped, not caught
+        if self.sub_window is not None:
+            if not sip.isdeleted(self.sub_window):
                 self.sub_window.close()
-            except RuntimeError:
-                # Window already deleted by Qt
-                pass
             self.sub_window = None
             
         # Remove this instance from the list of open instances
-        if self in HciMainUI.open_instances:
-            HciMainUI.open_instances.remove(self)
+        self._unregister()
           
         # Call destroy handler if set
         if self._destroy_window_handler:
@@ -510,10 +645,8 @@ class HciMainUI(QWidget):
             except Exception:
                 pass  # Ignore errors in handler
         # Clean up
-        try:
+        if not sip.isdeleted(self):
             self.deleteLater()
-        except RuntimeError:
-            pass  # Already deleted
         
     def init_ui(self):
         """Initialize the UI components"""
@@ -534,8 +667,9 @@ class HciMainUI(QWidget):
         # title_layout.addStretch(1)
         # main_layout.addLayout(title_layout)
              # Command selector
-        baudrate = self.transport.get_config().get("baudrate", 115200)
-        self.command_selector = HciCommandSelector(baudrate)
+        # get_config() builds a fresh dict from the interface each call, read it once
+        self._baudrate = self.transport.get_config().get("baudrate", 115200)
+        self.command_selector = HciCommandSelector(self._baudrate)
         self.command_selector.command_selected.connect(lambda category_opcode, command_opcode : self._cmd_factory.execute_command(category=category_opcode, opcode=command_opcode))
         def _on_enable_changed(state) -> None:
             """Handle enable checkbox state change"""
@@ -555,21 +689,16 @@ class HciMainUI(QWidget):
         # line.setFrameShape(QFrame.HLine)
         # line.setFrameShadow(QFrame.Sunken)
         # main_layout.addWidget(line)
-        self.sub_window = QMdiSubWindow()
+        # the MDI area builds the subwindow around this widget, already parented
+        # and with its flags set, and marks it WA_DeleteOnClose
+        self.sub_window = self.main_window.mdi_area.addSubWindow(self, Qt.Window)
         self.sub_window.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         self.sub_window.setWindowTitle(self.title)
         self.sub_window.setWindowIconText("HCI commands")  # Set window icon text
-        self.sub_window.setWidget(self)
-
-         # set the window flags to make it a top-level, resizable window
-        self.sub_window.setWindowFlags(Qt.Window | Qt.WindowStaysOnTopHint | Qt.WindowCloseButtonHint | Qt.WindowMinMaxButtonsHint)
-
-        self.sub_window.setWindowFlags(Qt.Window)  # Set window flags to make it a top-level window
         self.sub_window.setWindowModality(Qt.ApplicationModal)  # Set window modality to application modal
         # sizing the subwindow
         self.sub_window.resize(300, 700)
         self.sub_window.setMinimumSize(200, 400)  # Set minimum size
-        self.sub_window.setAttribute(Qt.WA_DeleteOnClose, True)  # Enable deletion on close
         
         
         # define the command and event factories. Both go through the session:
@@ -579,6 +708,10 @@ class HciMainUI(QWidget):
                                               self.transport, self.session)
         self._evt_factory = HCIEventFactory(self.title, self.sub_window,
                                             self.transport, self.session)
+        # leading-edge throttle for raising the factory windows on clicks
+        self._raise_throttle = QTimer(self)
+        self._raise_throttle.setSingleShot(True)
+        self._raise_throttle.setInterval(100)
         
         # callbacks when transport state changes
         self.transport.add_callback(TransportEvent.CONNECT, self.command_selector._on_device_connected)
@@ -586,7 +719,7 @@ class HciMainUI(QWidget):
         self.transport.add_callback(TransportEvent.DISCONNECT, lambda _ : (self._cmd_factory.close_all_command_windows(), self._evt_factory.close_all_event_windows()))
 
         # callback when subwindow is destroyed
-        self.sub_window.destroyed.connect(lambda : (setattr(self, 'sub_window', None), self._cleanup()))
+        self.sub_window.destroyed.connect(self._on_sub_window_destroyed, Qt.DirectConnection)
         # show the subwindow in the main window's MDI area
         self.sub_window.raise_()  # Bring the subwindow to the front
         self.sub_window.activateWindow()  # Activate the subwindow
@@ -594,27 +727,57 @@ class HciMainUI(QWidget):
        
     def show_window(self):
         """Show the HCI Main UI in a subwindow"""    
-        # Add the subwindow to the MDI area
-        self.main_window.mdi_area.addSubWindow(self.sub_window)
+        # init_ui already added the subwindow to the MDI area
         self.sub_window.show()
         
+    def _on_sub_window_destroyed(self):
+        """Drop the dead sub window and tear down what hangs off it"""
+        self.sub_window = None
+        self._cleanup()
+        
     def register_destroy(self, handler : callable):
         """Register a handler to be called when the window is destroyed"""
         self._destroy_window_handler = handler
         
     ########################################################
     
+    def closeEvent(self, event):
+        """Leave the registry as soon as the window closes, tear down the rest later"""
+        if not self._is_destroyed:
+            # closed windows must not be offered to the session pickers while
+            # the sub window waits for its deferred delete
+            self._unregister()
+            # close the command/event windows once this event has returned, so
+            # the sub window finishes its own close first
+            QTimer.singleShot(0, self._close_factory_windows)
+        event.accept()
+
+    def _close_factory_windows(self):
+        """Close every command and event window opened from this window"""
+        if self._cmd_factory:
+            self._cmd_factory.close_all_command_windows()
+        if self._evt_factory:
+            self._evt_factory.close_all_event_windows()
+
     def mousePressEvent(self, event):
         """Handle mouse press events - raise all command windows when clicked"""
         if self._is_destroyed:
             return
             
         # Call the base class implementation first
-        try:
-            super().mousePressEvent(event)
-        except RuntimeError:
+        super().mousePressEvent(event)
+        # Raise all command windows when any mouse button is clicked, at most
+        # once per throttle interval so a burst of clicks raises them once
+        if self._raise_throttle.isActive():
             return
-        # Raise all command windows when any mouse button is clicked
-        self._cmd_factory.raise_all_windows()
-        self._evt_factory.raise_all_windows()
+        self._raise_throttle.start()
+        # restack once the event queue drains instead of inside the press
+        QTimer.singleShot(0, self._raise_factory_windows)
+
+    def _raise_factory_windows(self):
+        """Raise every command and event window opened from this window"""
+        if self._cmd_factory:
+            self._cmd_factory.raise_all_windows()
+        if self._evt_factory:
+            self._evt_factory.raise_all_windows()
         
\ No newline at end of file
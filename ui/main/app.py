@@ -11,11 +11,71 @@ from PyQt5.QtWidgets import (
 
 import os
 from collections import namedtuple
+from functools import lru_cache, partial
+from importlib import import_module
+from typing import Callable, Optional, Sequence
+
+
+def _cached_import(module_name : str, attr : str):
+    """Import ui.exts.<module_name> on first use and return one of its attributes"""
+    module_path = f"ui.exts.{module_name}"
+    # sys.modules is checked first so repeated clicks skip the import machinery
+    module = sys.modules.get(module_path) or import_module(module_path)
+    return getattr(module, attr)
+
+
+# menu bar layout: (menu name, action titles), in display order
+_MENU_SPEC = (
+    ("File",    ("New", "Open log", "Save log")),
+    ("Edit",    ("Copy", "Find", "Find Next", "Find Previous", "save app log")),
+    ("View",    ("Zoom In", "Zoom Out", "Log Window", "clear log")),
+    ("Tools",   ("HCI", "Quick Connect", "LE Control", "Diagnostics", "Throughput Test", "SCO Test",
+                 "LE ISO Test", "HID Test", "A2DP Test", "Firmware Download", "util screen")),
+    ("setting", ("Close All", "app setting", "config chip")),
+    ("Help",    ("about", "Paths", "Documentation")),
+)
+
+# Define a simple struct-like mapping; modules are named, not imported,
+# so a tool's module is only loaded when its menu entry is used
+ChildFactory = namedtuple('ChildFactory', ['module', 'cls_name'])
+MethodFactory = namedtuple('MethodFactory', ['module', 'func_name'])
+
+# Define a mapping of titles to child window classes
+_WINDOW_MAP = {
+    "HCI":           ChildFactory(module="hci_window",    cls_name="HCIControl"),
+    "Quick Connect": ChildFactory(module="quick_connect",  cls_name="QuickConnectWindow"),
+    "LE Control":   ChildFactory(module="le_screen",       cls_name="LeControlWindow"),
+    "Diagnostics":  ChildFactory(module="diagnostic",     cls_name="DiagnosticWindow"),
+    "Throughput Test": ChildFactory(module="throughput_test", cls_name="ThroughputWindow"),
+    "SCO Test":     ChildFactory(module="sco_test",        cls_name="ScoTestWindow"),
+    "LE ISO Test":  ChildFactory(module="le_iso_test",     cls_name="LeIsoTestWindow"),
+    "HID Test":     ChildFactory(module="hid_test",        cls_name="HidTestWindow"),
+    "A2DP Test":    ChildFactory(module="a2dp_test",       cls_name="A2dpTestWindow"),
+    "Firmware Download": ChildFactory(module="firmware_download", cls_name="FirmwareDownloadWindow"),
+    "config chip":  ChildFactory(module="config_chip",     cls_name="ConfigChipWindow"),
+    "Log Window":   ChildFactory(module="log_window",      cls_name="LogWindow"),
+    "util screen":  ChildFactory(module="util_screen",     cls_name="UtilScreenWindow"),
+}
+# also create a utility function map that maps the action name to the function
+_UTILITY_MAP = {
+    "app setting": MethodFactory(module="util_screen", func_name="AppSettingWindow"),
+    "Paths":       MethodFactory(module="util_screen", func_name="PathsWindow"),
+    "Documentation": MethodFactory(module="util_screen", func_name="DocumentationWindow"),
+    "about":       MethodFactory(module="util_screen", func_name="AboutWindow"),
+    "clear log":   MethodFactory(module="log_window", func_name="ClearLogWindow"),
+}
+
+# the menu has a fixed set of titles, so every resolved handler stays cached;
+# a failed resolution raises and is retried on the next click
+@lru_cache(maxsize=32)
+def _resolve(title : str) -> Optional[Callable]:
+    """The create_instance or utility function behind a menu title, None when it has none"""
+    if (info := _WINDOW_MAP.get(title)) is not None:
+        return _cached_import(info.module, info.cls_name).create_instance
+    if (info := _UTILITY_MAP.get(title)) is not None:
+        return _cached_import(info.module, info.func_name)
+    return None
 
-from ui.exts import (a2dp_test, diagnostic, hci_window, hid_test,
-                          le_iso_test, sco_test, throughput_test, firmware_download,
-                          config_chip, log_window, util_screen, quick_connect,
-                          le_screen)
 
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -37,12 +97,8 @@ class MainWindow(QMainWindow):
         self.menu_bar = self.menuBar()
 
         # Menus
-        self.create_menu("File", ["New", "Open log", "Save log"])
-        self.create_menu("Edit", [ "Copy", "Find", "Find Next", "Find Previous", "save app log" ])
-        self.create_menu("View", ["Zoom In", "Zoom Out", "Log Window", "clear log"])
-        self.create_menu("Tools", ["HCI", "Quick Connect", "LE Control", "Diagnostics", "Throughput Test", "SCO Test", "LE ISO Test", "HID Test", "A2DP Test", "Firmware Download", "util screen"])
-        self.create_menu("setting", ["Close All", "app setting", "config chip"])
-        self.create_menu("Help", ["about","Paths" ,"Documentation"])
+        for menu_name, actions in _MENU_SPEC:
+            self.create_menu(menu_name, actions)
         
         # bind the quit action to the close event
         quit_action = QAction("Quit", self)
@@ -50,11 +106,12 @@ class MainWindow(QMainWindow):
         self.menu_bar.addAction(quit_action)
         # Add actions to the menu bar
 
-    def create_menu(self, menu_name, actions : list[str]):
+    def create_menu(self, menu_name, actions : Sequence[str]):
         menu = self.menu_bar.addMenu(menu_name)
         for action_name in actions:
             action = QAction(action_name, self)
-            action.triggered.connect(lambda checked, name=action_name: self.open_child_window(name))
+            # triggered's checked argument is dropped by PyQt, the partial gets none
+            action.triggered.connect(partial(self.open_child_window, action_name))
             menu.addAction(action)
 
     def open_child_window(self, title : str)->None:
@@ -62,51 +119,15 @@ class MainWindow(QMainWindow):
         Open a child window based on the title.
         If the title is not found in the mapping, a default child window is opened.
         """
-        # Define a simple struct‐like mapping
-        ChildFactory = namedtuple('ChildFactory', ['module', 'cls_name'])
-        # Define a mapping of titles to child window classes
-        WINDOW_MAP = {
-            "HCI":           ChildFactory(module=hci_window,    cls_name="HCIControl"),
-            "Quick Connect": ChildFactory(module=quick_connect,  cls_name="QuickConnectWindow"),
-            "LE Control":   ChildFactory(module=le_screen,       cls_name="LeControlWindow"),
-            "Diagnostics":  ChildFactory(module=diagnostic,     cls_name="DiagnosticWindow"),
-            "Throughput Test": ChildFactory(module=throughput_test, cls_name="ThroughputWindow"),
-            "SCO Test":     ChildFactory(module=sco_test,        cls_name="ScoTestWindow"),
-            "LE ISO Test":  ChildFactory(module=le_iso_test,     cls_name="LeIsoTestWindow"),
-            "HID Test":     ChildFactory(module=hid_test,        cls_name="HidTestWindow"),
-            "A2DP Test":    ChildFactory(module=a2dp_test,       cls_name="A2dpTestWindow"),
-            "Firmware Download": ChildFactory(module=firmware_download, cls_name="FirmwareDownloadWindow"),
-            "config chip":  ChildFactory(module=config_chip,     cls_name="ConfigChipWindow"),
-            "Log Window":   ChildFactory(module=log_window,      cls_name="LogWindow"),
-            "util screen":  ChildFactory(module=util_screen,     cls_name="UtilScreenWindow"),
-        }
-        # Define a mapping of titles to utility functions
-        methodFactory = namedtuple('ChildFactory', ['module', 'func_name'])
-        # also create a utility function map that maps the action name to the function
-        UTILITY_MAP = {
-            "app setting": methodFactory(module=util_screen, func_name="AppSettingWindow"),
-            "Paths":       methodFactory(module=util_screen, func_name="PathsWindow"),
-            "Documentation": methodFactory(module=util_screen, func_name="DocumentationWindow"),
-            "about":       methodFactory(module=util_screen, func_name="AboutWindow"),
-            "clear log":   methodFactory(module=log_window, func_name="ClearLogWindow"),
-        }
-        
-        # --- inside MainWindow.open_child_window ---
-        if title in WINDOW_MAP:
-            info = WINDOW_MAP[title]
-            # dynamically fetch the class from the module
+        if title in _WINDOW_MAP:
             try:
-                cls = getattr(info.module, info.cls_name) ## info.module.__dict__[info.cls_name]
-                #invoke the create_instance method of the class
-                instance_method = getattr(cls, "create_instance")
-                instance_method(self)
+                # the class's create_instance, resolved on the first click
+                _resolve(title)(self)
             except Exception as e:
                 print(f"Error loading {title}: {e}")
                 # Optionally, you can log the error or handle it as needed
                 # For example, you could write to a log file or display a message box
-        elif title in UTILITY_MAP:
-            info = UTILITY_MAP[title]
-            
+        elif title in _UTILITY_MAP:
             ## @todo : remove this after testing
             if title == "app setting":
                 #execute the test 
@@ -114,9 +135,7 @@ class MainWindow(QMainWindow):
                 test_multiple_logger_threads()
                 return  
             
-            # dynamically fetch the class from the module
-            func = getattr(info.module, info.func_name) ## info.module.__dict__[info.cls_name]   
-            func()
+            _resolve(title)()
         else:
             # Fallback to a default child window if the title is not found
             pass
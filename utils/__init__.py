@@ -16,12 +16,7 @@ parsing, and serialization.
 # utility functions that can be imported and used in other modules.
 """
 
-from .async_exec import *
-from .asyncio_files import *
-from .Exceptions import *
-from .file_handler import *
-from .logger import *
-from .yaml_cfg_parser import *
+import importlib
 
 from .shutdown_handler import register_shutdown, unregister_shutdown, unregister_group, trigger_shutdown, get_shutdown_status
 
@@ -48,4 +43,36 @@ __all__ = [
     'unregister_group',
     'trigger_shutdown',
     'get_shutdown_status',
-]
\ No newline at end of file
+]
+
+# The submodules (and the logger names re-exported from them) are imported on
+# first access (PEP 562), so importing one utility does not load the logger,
+# the YAML parser and the log window along with it.
+_SUBMODULES = frozenset(('async_exec', 'asyncio_files', 'Exceptions',
+                         'file_handler', 'logger', 'yaml_cfg_parser'))
+_LAZY = {
+    'log_level_map':          'logger',
+    'LogLevel':               'logger',
+    'EnhancedLogManager':     'logger',
+    'configure_logging':      'logger',
+    'get_logger':             'logger',
+    'reload_config':          'logger',
+    'get_logging_statistics': 'logger',
+    'shutdown_logging':       'logger',
+    'global_setting_parser':  'yaml_cfg_parser',
+}
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    elif name in _LAZY:
+        value = getattr(importlib.import_module(f".{_LAZY[name]}", __name__), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return __all__